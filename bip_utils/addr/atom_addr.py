@@ -21,7 +21,7 @@
 """Module for Atom address encoding/decoding."""
 
 # Imports
-from typing import Any, Union
+from typing import Any, List, Sequence, Union
 
 from bip_utils.addr.addr_dec_utils import AddrDecUtils
 from bip_utils.addr.addr_key_validator import AddrKeyValidator
@@ -29,9 +29,43 @@ from bip_utils.addr.iaddr_decoder import IAddrDecoder
 from bip_utils.addr.iaddr_encoder import IAddrEncoder
 from bip_utils.bech32 import Bech32ChecksumError, Bech32Decoder, Bech32Encoder
 from bip_utils.ecc import IPublicKey
+from bip_utils.ecc.conf import EccConf
 from bip_utils.utils.crypto import Hash160
 
 
+# Use coincurve directly for public key bytes, if enabled
+if EccConf.USE_COINCURVE:
+    import coincurve
+
+
+class _AtomAddrUtils:
+    """Class container for Atom address utility functions."""
+
+    @staticmethod
+    def GetCompressedKeyBytes(pub_key: Union[bytes, IPublicKey]) -> bytes:
+        """
+        Validate a secp256k1 public key and get its compressed bytes.
+
+        Args:
+            pub_key (bytes or IPublicKey): Public key bytes or object
+
+        Returns:
+            bytes: Compressed public key bytes
+
+        Raises:
+            ValueError: If the public key is not valid
+            TypeError: If the public key is not secp256k1
+        """
+
+        # Validate and compress key bytes directly with coincurve, without building a key object
+        if EccConf.USE_COINCURVE and isinstance(pub_key, bytes):
+            try:
+                return coincurve.PublicKey(pub_key).format(compressed=True)
+            except ValueError as ex:
+                raise ValueError("Invalid public key bytes") from ex
+        return AddrKeyValidator.ValidateAndGetSecp256k1Key(pub_key).RawCompressed().ToBytes()
+
+
 class AtomAddrDecoder(IAddrDecoder):
     """
     Atom address decoder class.
@@ -95,9 +129,39 @@ class AtomAddrEncoder(IAddrEncoder):
         """
         hrp = kwargs["hrp"]
 
-        pub_key_obj = AddrKeyValidator.ValidateAndGetSecp256k1Key(pub_key)
         return Bech32Encoder.Encode(hrp,
-                                    Hash160.QuickDigest(pub_key_obj.RawCompressed().ToBytes()))
+                                    Hash160.QuickDigest(_AtomAddrUtils.GetCompressedKeyBytes(pub_key)))
+
+    @staticmethod
+    def EncodeKeys(pub_keys: Sequence[Union[bytes, IPublicKey]],
+                   **kwargs: Any) -> List[str]:
+        """
+        Encode multiple public keys to Atom addresses.
+        It gives the same result of calling EncodeKey for each key, but it's faster for big batches.
+
+        Args:
+            pub_keys (list[bytes or IPublicKey]): Public keys bytes or objects
+
+        Other Parameters:
+            hrp (str): HRP
+
+        Returns:
+            list[str]: Address strings
+
+        Raises:
+            ValueError: If one of the public keys is not valid
+            TypeError: If one of the public keys is not secp256k1
+        """
+        hrp = kwargs["hrp"]
+
+        # Bind functions locally, then process the whole batch one step at a time
+        get_key_bytes = _AtomAddrUtils.GetCompressedKeyBytes
+        hash160 = Hash160.QuickDigest
+        encode = Bech32Encoder.Encode
+
+        pub_keys_bytes = [get_key_bytes(pub_key) for pub_key in pub_keys]
+        keys_hash = [hash160(pub_key_bytes) for pub_key_bytes in pub_keys_bytes]
+        return [encode(hrp, key_hash) for key_hash in keys_hash]
 
 
 # Deprecated: only for compatibility,, Encoder class shall be used instead
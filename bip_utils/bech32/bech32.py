@@ -29,6 +29,7 @@ References:
 
 # Imports
 from enum import Enum, auto, unique
+from functools import lru_cache
 from typing import Dict, List
 
 from bip_utils.bech32.bech32_base import Bech32BaseUtils, Bech32DecoderBase, Bech32EncoderBase
@@ -61,12 +62,14 @@ class Bech32Utils:
     """Class container for Bech32 utility functions."""
 
     @staticmethod
-    def PolyMod(values: List[int]) -> int:
+    def PolyMod(values: List[int],
+                chk: int = 1) -> int:
         """
         Computes the polynomial modulus.
 
         Args:
-            values (list[int]): List of polynomial coefficients
+            values (list[int]) : List of polynomial coefficients
+            chk (int, optional): Initial modulus, to continue a previous computation (default: 1)
 
         Returns:
             int: Computed modulus
@@ -76,7 +79,6 @@ class Bech32Utils:
         generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
 
         # Compute modulus
-        chk = 1
         for value in values:
             top = chk >> 25
             chk = (chk & 0x1ffffff) << 5 ^ value
@@ -98,6 +100,21 @@ class Bech32Utils:
         # [upper 3 bits of each character] + [0] + [lower 5 bits of each character]
         return [ord(x) >> 5 for x in hrp] + [0] + [ord(x) & 0x1f for x in hrp]
 
+    @staticmethod
+    @lru_cache()
+    def HrpPolyMod(hrp: str) -> int:
+        """
+        Compute the polynomial modulus of the expanded HRP.
+        The result is cached, since addresses of the same coin always share the HRP.
+
+        Args:
+            hrp (str): HRP
+
+        Returns:
+            int: Computed modulus
+        """
+        return Bech32Utils.PolyMod(Bech32Utils.HrpExpand(hrp))
+
     @staticmethod
     def ComputeChecksum(hrp: str,
                         data: List[int],
@@ -113,8 +130,8 @@ class Bech32Utils:
         Returns:
             list[int]: Computed checksum
         """
-        values = Bech32Utils.HrpExpand(hrp) + data
-        polymod = Bech32Utils.PolyMod(values + [0, 0, 0, 0, 0, 0]) ^ Bech32Const.ENCODING_CHECKSUM_CONST[encoding]
+        polymod = (Bech32Utils.PolyMod(data + [0, 0, 0, 0, 0, 0], Bech32Utils.HrpPolyMod(hrp))
+                   ^ Bech32Const.ENCODING_CHECKSUM_CONST[encoding])
         return [(polymod >> 5 * (5 - i)) & 0x1f for i in range(Bech32Const.CHECKSUM_STR_LEN)]
 
     @staticmethod
@@ -132,7 +149,7 @@ class Bech32Utils:
         Returns:
             bool: True if valid, false otherwise
         """
-        polymod = Bech32Utils.PolyMod(Bech32Utils.HrpExpand(hrp) + data)
+        polymod = Bech32Utils.PolyMod(data, Bech32Utils.HrpPolyMod(hrp))
         return polymod == Bech32Const.ENCODING_CHECKSUM_CONST[encoding]
 
 
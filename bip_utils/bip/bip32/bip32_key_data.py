@@ -46,6 +46,8 @@ class Bip32KeyDataConst:
     KEY_INDEX_MAX_VAL: int = 2**32 - 1
     # Key index hardened bit number
     KEY_INDEX_HARDENED_BIT_NUM: int = 31
+    # Key index hardened bit mask
+    KEY_INDEX_HARDENED_BIT_MASK: int = 1 << KEY_INDEX_HARDENED_BIT_NUM
 
 
 class Bip32ChainCode(DataBytes):
@@ -257,6 +259,8 @@ class Bip32KeyIndex:
     It represents a BIP32 key index.
     """
 
+    __slots__ = ("m_idx",)
+
     m_idx: int
 
     @staticmethod
@@ -365,7 +369,7 @@ class Bip32KeyIndex:
         Returns:
             bool: True if hardened, false otherwise
         """
-        return self.IsHardenedIndex(self.m_idx)
+        return (self.m_idx & Bip32KeyDataConst.KEY_INDEX_HARDENED_BIT_MASK) != 0
 
     def ToBytes(self,
                 endianness: Literal["little", "big"] = "big") -> bytes:
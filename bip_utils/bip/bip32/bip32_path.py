@@ -23,10 +23,11 @@
 # Import
 from __future__ import annotations
 
-from typing import Iterator, List, Optional, Sequence, Tuple, Union
+import re
+from typing import Dict, Iterator, List, Optional, Pattern, Sequence, Tuple, Union
 
 from bip_utils.bip.bip32.bip32_ex import Bip32PathError
-from bip_utils.bip.bip32.bip32_key_data import Bip32KeyIndex
+from bip_utils.bip.bip32.bip32_key_data import Bip32KeyDataConst, Bip32KeyIndex
 
 
 class Bip32PathConst:
@@ -36,6 +37,45 @@ class Bip32PathConst:
     HARDENED_CHARS: Tuple[str, str, str] = ("'", "h", "p")
     # Master character
     MASTER_CHAR: str = "m"
+    # Regex for path element: index (group 1) and optional hardened character (group 2), surrounded by spaces
+    RE_PATH_ELEM: Pattern[str] = re.compile(r"\s*(\d+)([" + re.escape("".join(HARDENED_CHARS)) + r"])?\s*\Z")
+    # Maximum number of cached path elements
+    ELEMS_CACHE_MAX_SIZE: int = 4096
+
+
+class _Bip32PathElemsCache:
+    """
+    Class for caching path elements.
+    Bip32KeyIndex objects are never modified after construction, so the same object can be shared by all paths
+    (indexes like 0, 1, 44' are used by almost every path).
+    """
+
+    m_elems: Dict[int, Bip32KeyIndex] = {}
+
+    @classmethod
+    def GetElem(cls,
+                elem: int) -> Bip32KeyIndex:
+        """
+        Get the Bip32KeyIndex object for the specified index, constructing it only if not cached.
+
+        Args:
+            elem (int): Path element
+
+        Returns:
+            Bip32KeyIndex object: Bip32KeyIndex object
+
+        Raises:
+            ValueError: If the index value is not valid
+        """
+        try:
+            return cls.m_elems[elem]
+        except KeyError:
+            key_idx = Bip32KeyIndex(elem)
+            # Just clear the cache when full, it'll be filled again with the most used indexes
+            if len(cls.m_elems) >= Bip32PathConst.ELEMS_CACHE_MAX_SIZE:
+                cls.m_elems.clear()
+            cls.m_elems[elem] = key_idx
+            return key_idx
 
 
 class Bip32Path:
@@ -44,7 +84,10 @@ class Bip32Path:
     It represents a BIP-0032 path.
     """
 
-    m_elems: List[Bip32KeyIndex]
+    __slots__ = ("m_elems", "m_elems_int", "m_is_absolute")
+
+    m_elems: Tuple[Bip32KeyIndex, ...]
+    m_elems_int: Tuple[int, ...]
     m_is_absolute: bool
 
     def __init__(self,
@@ -58,12 +101,16 @@ class Bip32Path:
             is_absolute (bool, optional): True if path is an absolute one, false otherwise (default: True)
         """
         try:
-            self.m_elems = ([]
+            # Stored as tuple, since elements are never modified
+            self.m_elems = (()
                             if elems is None
-                            else [Bip32KeyIndex(elem) if isinstance(elem, int) else elem for elem in elems])
+                            else tuple([_Bip32PathElemsCache.GetElem(elem) if isinstance(elem, int) else elem
+                                        for elem in elems]))
         except ValueError as ex:
             raise Bip32PathError("The path contains some invalid key indexes") from ex
 
+        # Keep elements also as integers, since they are often requested in this form
+        self.m_elems_int = tuple(map(int, self.m_elems))
         self.m_is_absolute = is_absolute
 
     def AddElem(self,
@@ -81,8 +128,8 @@ class Bip32Path:
             Bip32PathError: If the path element is not valid
         """
         if isinstance(elem, int):
-            elem = Bip32KeyIndex(elem)
-        return Bip32Path(self.m_elems + [elem], self.m_is_absolute)
+            elem = _Bip32PathElemsCache.GetElem(elem)
+        return Bip32Path(self.m_elems + (elem,), self.m_is_absolute)
 
     def IsAbsolute(self) -> bool:
         """
@@ -100,7 +147,7 @@ class Bip32Path:
         Returns:
             int: Number of elements
         """
-        return len(self.m_elems)
+        return len(self.m_elems_int)
 
     def ToList(self) -> List[int]:
         """
@@ -109,7 +156,7 @@ class Bip32Path:
         Returns:
             list[int]: Path as a list of integers
         """
-        return [int(elem) for elem in self.m_elems]
+        return list(self.m_elems_int)
 
     def ToStr(self) -> str:
         """
@@ -118,12 +165,14 @@ class Bip32Path:
         Returns:
             str: Path as a string
         """
+        hardened_bit_mask = Bip32KeyDataConst.KEY_INDEX_HARDENED_BIT_MASK
+
         path_str = "" if not self.m_is_absolute else f"{Bip32PathConst.MASTER_CHAR}/"
-        for elem in self.m_elems:
-            if not elem.IsHardened():
-                path_str += f"{str(elem.ToInt())}/"
+        for elem in self.m_elems_int:
+            if (elem & hardened_bit_mask) == 0:
+                path_str += f"{elem}/"
             else:
-                path_str += f"{str(Bip32KeyIndex.UnhardenIndex(elem.ToInt()))}'/"
+                path_str += f"{elem & ~hardened_bit_mask}'/"
 
         return path_str[:-1]
 
@@ -156,46 +205,49 @@ class Bip32Path:
         Returns:
             Iterator object: Iterator to the current element
         """
-        yield from self.m_elems
+        return iter(self.m_elems)
 
+    def __len__(self) -> int:
+        """
+        Get the number of elements of the path.
 
-class Bip32PathParser:
-    """
-    BIP32 path parser class.
-    It parses a BIP-0032 path and returns a Bip32Path object.
-    """
+        Returns:
+            int: Number of elements
+        """
+        return len(self.m_elems_int)
 
-    @staticmethod
-    def Parse(path: str) -> Bip32Path:
+    def __contains__(self,
+                     elem: object) -> bool:
         """
-        Parse a path and return a Bip32Path object.
+        Get if the path contains the specified element.
 
         Args:
-            path (str): Path
+            elem (int or Bip32KeyIndex object): Element to search
 
         Returns:
-            Bip32Path object: Bip32Path object
+            bool: True if the path contains the element, false otherwise
 
         Raises:
-            Bip32PathError: If the path is not valid
+            TypeError: If the element is not of the correct type
         """
+        if not isinstance(elem, (int, Bip32KeyIndex)):
+            raise TypeError(f"Invalid type for checking element ({type(elem)})")
+        return int(elem) in self.m_elems_int
 
-        # Remove trailing "/" if any
-        if path.endswith("/"):
-            path = path[:-1]
 
-        # Parse elements
-        return Bip32PathParser.__ParseElements(
-            list(filter(None, path.split("/")))
-        )
+class Bip32PathParser:
+    """
+    BIP32 path parser class.
+    It parses a BIP-0032 path and returns a Bip32Path object.
+    """
 
     @staticmethod
-    def __ParseElements(path_elems: List[str]) -> Bip32Path:
+    def Parse(path: str) -> Bip32Path:
         """
-        Parse path elements and return a Bip32Path object.
+        Parse a path and return a Bip32Path object.
 
         Args:
-            path_elems (list[str]): Path elements
+            path (str): Path
 
         Returns:
             Bip32Path object: Bip32Path object
@@ -204,16 +256,17 @@ class Bip32PathParser:
             Bip32PathError: If the path is not valid
         """
 
-        # Remove the initial "m" character if any
-        if len(path_elems) > 0 and path_elems[0] == Bip32PathConst.MASTER_CHAR:
-            path_elems = path_elems[1:]
-            is_absolute = True
-        else:
-            is_absolute = False
+        # Split in a single pass, skipping empty elements (e.g. trailing or repeated "/")
+        path_elems = [path_elem for path_elem in path.split("/") if path_elem != ""]
+
+        # Skip the initial "m" character if any
+        is_absolute = len(path_elems) > 0 and path_elems[0] == Bip32PathConst.MASTER_CHAR
+        start_idx = 1 if is_absolute else 0
 
         # Parse elements
-        parsed_elems = list(map(Bip32PathParser.__ParseElem, path_elems))
-        return Bip32Path(parsed_elems, is_absolute)
+        parse_elem = Bip32PathParser.__ParseElem
+        return Bip32Path([parse_elem(path_elems[i]) for i in range(start_idx, len(path_elems))],
+                         is_absolute)
 
     @staticmethod
     def __ParseElem(path_elem: str) -> int:
@@ -230,18 +283,9 @@ class Bip32PathParser:
             Bip32PathError: If the path is not valid
         """
 
-        # Strip spaces
-        path_elem = path_elem.strip()
-
-        # Get if hardened
-        is_hardened = path_elem.endswith(Bip32PathConst.HARDENED_CHARS)
-
-        # If hardened, remove the last character from the string
-        if is_hardened:
-            path_elem = path_elem[:-1]
-
-        # The remaining string shall be numeric
-        if not path_elem.isnumeric():
-            raise Bip32PathError(f"Invalid path element ({path_elem})")
+        elem_match = Bip32PathConst.RE_PATH_ELEM.match(path_elem)
+        if elem_match is None:
+            raise Bip32PathError(f"Invalid path element ({path_elem.strip()})")
 
-        return int(path_elem) if not is_hardened else Bip32KeyIndex.HardenIndex(int(path_elem))
+        idx = int(elem_match.group(1))
+        return idx if elem_match.group(2) is None else idx | Bip32KeyDataConst.KEY_INDEX_HARDENED_BIT_MASK
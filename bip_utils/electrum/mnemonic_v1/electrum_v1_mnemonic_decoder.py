@@ -24,7 +24,7 @@ Reference: https://github.com/spesmilo/electrum
 """
 
 # Imports
-from typing import Optional, Union
+from typing import List, Optional, Tuple, Union
 
 from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic import (
     ElectrumV1Languages, ElectrumV1Mnemonic, ElectrumV1MnemonicConst
@@ -32,7 +32,7 @@ from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic import (
 from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic_utils import (
     ElectrumV1WordsListFinder, ElectrumV1WordsListGetter
 )
-from bip_utils.utils.mnemonic import Mnemonic, MnemonicDecoderBase, MnemonicUtils
+from bip_utils.utils.mnemonic import Mnemonic, MnemonicDecoderBase, MnemonicUtils, MnemonicWordsList
 
 
 class ElectrumV1MnemonicDecoder(MnemonicDecoderBase):
@@ -41,6 +41,8 @@ class ElectrumV1MnemonicDecoder(MnemonicDecoderBase):
     It decodes a mnemonic phrase to bytes.
     """
 
+    m_detected_words_list: Optional[MnemonicWordsList]
+
     def __init__(self,
                  lang: Optional[ElectrumV1Languages] = ElectrumV1Languages.ENGLISH) -> None:
         """
@@ -56,6 +58,7 @@ class ElectrumV1MnemonicDecoder(MnemonicDecoderBase):
             ValueError: If loaded words list is not valid
         """
         super().__init__(lang, ElectrumV1WordsListFinder, ElectrumV1WordsListGetter)
+        self.m_detected_words_list = None
 
     def Decode(self,
                mnemonic: Union[str, Mnemonic]) -> bytes:
@@ -77,16 +80,46 @@ class ElectrumV1MnemonicDecoder(MnemonicDecoderBase):
         if mnemonic_obj.WordsCount() not in ElectrumV1MnemonicConst.MNEMONIC_WORD_NUM:
             raise ValueError(f"Mnemonic words count is not valid ({mnemonic_obj.WordsCount()})")
 
-        # Detect language if it was not specified at construction
-        words_list, _ = self._FindLanguage(mnemonic_obj)
-
-        # Get words
-        words = mnemonic_obj.ToList()
+        # Get word indexes, each word is searched only once
+        words_list, words_idx = self.__GetWordsIdx(mnemonic_obj)
+        words_list_len = words_list.Length()
 
         # Consider 3 words at a time, 3 words represent 4 bytes
-        entropy_bytes = b""
-        for i in range(len(words) // 3):
-            word1, word2, word3 = words[i * 3:(i * 3) + 3]
-            entropy_bytes += MnemonicUtils.WordsToBytesChunk(word1, word2, word3, words_list, "big")
+        # Chunks are joined at the end, instead of concatenating them at every step
+        words_idx_to_bytes_chunk = MnemonicUtils.WordsIdxToBytesChunk
+        words_idx_it = iter(words_idx)
+        entropy_chunks = [words_idx_to_bytes_chunk(word1_idx, word2_idx, word3_idx, words_list_len, "big")
+                          for word1_idx, word2_idx, word3_idx in zip(words_idx_it, words_idx_it, words_idx_it)]
+
+        return b"".join(entropy_chunks)
+
+    def __GetWordsIdx(self,
+                      mnemonic: Mnemonic) -> Tuple[MnemonicWordsList, List[int]]:
+        """
+        Get the words list and the indexes of the mnemonic words.
+        If the language was not specified at construction, the last detected words list is tried first,
+        so the language is not detected again when decoding many mnemonics of the same language.
+
+        Args:
+            mnemonic (Mnemonic object): Mnemonic
+
+        Returns:
+            tuple[MnemonicWordsList, list[int]]: MnemonicWordsList object (index 0), word indexes (index 1)
+
+        Raises:
+            ValueError: If the mnemonic language cannot be found
+        """
+        words = mnemonic.ToList()
+
+        if self.m_detected_words_list is not None:
+            try:
+                return self.m_detected_words_list, [self.m_detected_words_list.GetWordIdx(word) for word in words]
+            except ValueError:
+                pass
+
+        # Detect language if it was not specified at construction
+        words_list, _ = self._FindLanguage(mnemonic)
+        if self.m_lang is None:
+            self.m_detected_words_list = words_list
 
-        return entropy_bytes
+        return words_list, [words_list.GetWordIdx(word) for word in words]
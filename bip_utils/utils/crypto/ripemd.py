@@ -21,6 +21,7 @@
 """Module for RIPEMD algorithm."""
 
 # Imports
+import hashlib
 from typing import Union
 
 from Crypto.Hash import RIPEMD160
@@ -28,6 +29,16 @@ from Crypto.Hash import RIPEMD160
 from bip_utils.utils.misc import AlgoUtils
 
 
+# Listing in hashlib.algorithms_available is not enough, since on some OpenSSL 3 versions RIPEMD160 is only
+# provided by the legacy provider and hashlib.new raises ValueError, so check it by actually creating it
+HASHLIB_USE_RIPEMD160: bool
+try:
+    hashlib.new("ripemd160")
+    HASHLIB_USE_RIPEMD160 = True
+except ValueError:
+    HASHLIB_USE_RIPEMD160 = False
+
+
 class Ripemd160:
     """
     RIPEMD160 class.
@@ -45,6 +56,9 @@ class Ripemd160:
         Returns:
             bytes: Computed digest
         """
+        if HASHLIB_USE_RIPEMD160:
+            return hashlib.new("ripemd160", AlgoUtils.Encode(data)).digest()
+        # Use Cryptodome if not implemented in hashlib (it depends on OpenSSL)
         return RIPEMD160.new(AlgoUtils.Encode(data)).digest()
 
     @staticmethod
@@ -55,4 +69,6 @@ class Ripemd160:
         Returns:
             int: Digest size in bytes
         """
-        return RIPEMD160.digest_size
+        return (hashlib.new("ripemd160").digest_size
+                if HASHLIB_USE_RIPEMD160
+                else RIPEMD160.digest_size)
@@ -77,16 +77,46 @@ class MnemonicUtils:
 
         Returns:
             bytes: Bytes chunk
+
+        Raises:
+            ValueError: If a word is not found or the words don't represent a valid bytes chunk
         """
-        n = words_list.Length()
+        return MnemonicUtils.WordsIdxToBytesChunk(words_list.GetWordIdx(word1),
+                                                  words_list.GetWordIdx(word2),
+                                                  words_list.GetWordIdx(word3),
+                                                  words_list.Length(),
+                                                  endianness)
 
-        # Get the word indexes
-        word1_idx = words_list.GetWordIdx(word1)
-        word2_idx = words_list.GetWordIdx(word2) % n
-        word3_idx = words_list.GetWordIdx(word3) % n
+    @staticmethod
+    def WordsIdxToBytesChunk(word1_idx: int,
+                             word2_idx: int,
+                             word3_idx: int,
+                             words_list_len: int,
+                             endianness: Literal["little", "big"]) -> bytes:
+        """
+        Get bytes chunk from word indexes.
+        Useful when the word indexes are already available, to avoid searching the words again.
+
+        Args:
+            word1_idx (int)               : Word 1 index
+            word2_idx (int)               : Word 2 index
+            word3_idx (int)               : Word 3 index
+            words_list_len (int)          : Words list length
+            endianness ("big" or "little"): Bytes endianness
+
+        Returns:
+            bytes: Bytes chunk
+
+        Raises:
+            ValueError: If the word indexes don't represent a valid bytes chunk
+        """
+        n = words_list_len
 
         # Get back the bytes chunk
         int_chunk = word1_idx + (n * ((word2_idx - word1_idx) % n)) + (n * n * ((word3_idx - word2_idx) % n))
+        # Some word combinations give a chunk that doesn't fit in 4 bytes
+        if int_chunk >> 32 != 0:
+            raise ValueError(f"Invalid words chunk (indexes: {word1_idx}, {word2_idx}, {word3_idx})")
 
         return IntegerUtils.ToBytes(int_chunk, bytes_num=4, endianness=endianness)
 
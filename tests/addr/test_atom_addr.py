@@ -19,6 +19,8 @@
 # THE SOFTWARE.
 
 # Imports
+import binascii
+
 from bip_utils import AtomAddr, AtomAddrDecoder, AtomAddrEncoder, CoinsConf
 from tests.addr.test_addr_base import AddrBaseTests
 from tests.addr.test_addr_const import TEST_SECP256K1_ADDR_INVALID_KEY_TYPES
@@ -125,6 +127,16 @@ class AtomAddrTests(AddrBaseTests):
     def test_encode_key(self):
         self._test_encode_key(AtomAddrEncoder, Secp256k1PublicKey, TEST_VECT)
 
+    # Test encode multiple keys
+    def test_encode_keys(self):
+        for test in TEST_VECT:
+            key_bytes = binascii.unhexlify(test["pub_key"])
+            addrs = AtomAddrEncoder.EncodeKeys([key_bytes, Secp256k1PublicKey.FromBytes(key_bytes)],
+                                               **test["address_params"])
+            self.assertEqual([test["address"], test["address"]], addrs)
+
+        self.assertEqual([], AtomAddrEncoder.EncodeKeys([], hrp="cosmos"))
+
     # Test decode address
     def test_decode_addr(self):
         self._test_decode_addr(AtomAddrDecoder, TEST_VECT)
@@ -142,6 +154,14 @@ class AtomAddrTests(AddrBaseTests):
             TEST_VECT_SECP256K1_PUB_KEY_INVALID
         )
 
+    # Test invalid keys for multiple encoding
+    def test_invalid_keys_encode_keys(self):
+        valid_key = binascii.unhexlify(TEST_VECT[0]["pub_key"])
+        for key in TEST_SECP256K1_ADDR_INVALID_KEY_TYPES:
+            self.assertRaises(TypeError, AtomAddrEncoder.EncodeKeys, [valid_key, key], hrp="")
+        for key in TEST_VECT_SECP256K1_PUB_KEY_INVALID:
+            self.assertRaises(ValueError, AtomAddrEncoder.EncodeKeys, [valid_key, binascii.unhexlify(key)], hrp="")
+
     # Test old address class
     def test_old_addr_cls(self):
         self.assertTrue(AtomAddr is AtomAddrEncoder)
@@ -19,6 +19,10 @@
 # THE SOFTWARE.
 
 # Imports
+import binascii
+
+import coincurve
+
 from bip_utils import EthAddr, EthAddrDecoder, EthAddrEncoder
 from tests.addr.test_addr_base import AddrBaseTests
 from tests.addr.test_addr_const import TEST_SECP256K1_ADDR_INVALID_KEY_TYPES
@@ -83,6 +87,16 @@ class EthAddrTests(AddrBaseTests):
     def test_encode_key(self):
         self._test_encode_key(EthAddrEncoder, Secp256k1PublicKey, TEST_VECT)
 
+    # Test encode uncompressed key
+    def test_encode_uncompressed_key(self):
+        # Decompress all keys first with coincurve (libsecp256k1), which is much faster than ecdsa
+        pub_keys_uncompr = [coincurve.PublicKey(binascii.unhexlify(test["pub_key"])).format(compressed=False)
+                            for test in TEST_VECT]
+
+        for test, pub_key_uncompr in zip(TEST_VECT, pub_keys_uncompr):
+            with self.subTest(address=test["address"]):
+                self.assertEqual(test["address"], EthAddrEncoder.EncodeKey(pub_key_uncompr, **test["address_params"]))
+
     # Test decode address
     def test_decode_addr(self):
         self._test_decode_addr(EthAddrDecoder, TEST_VECT)
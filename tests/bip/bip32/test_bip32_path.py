@@ -132,6 +132,12 @@ TEST_VECT_PATH = [
         "is_absolute": False,
         "to_str": "0'/1'/2",
     },
+    {
+        "path": "m/ 0h / 1' /2p ",
+        "parsed": [Bip32KeyIndex.HardenIndex(0), Bip32KeyIndex.HardenIndex(1), Bip32KeyIndex.HardenIndex(2)],
+        "is_absolute": True,
+        "to_str": "m/0'/1'/2'",
+    },
 ]
 
 # Tests for path add element
@@ -164,6 +170,10 @@ TEST_VECT_PATH_INVALID = [
     "m/0'0/1",
     "m/0p0/1",
     "m/a/1",
+    "m/'/1",
+    "m/h/1",
+    "m/0 h/1",
+    "m/0'p/1",
     "m/0 1/1",
     "0/a/1",
     "0/1/4294967296",
@@ -194,6 +204,24 @@ class Bip32PathTests(unittest.TestCase):
             path = path.AddElem(test["elem"])
             self.assertEqual(test["path"], path.ToStr())
 
+    # Test elements not contained in path
+    def test_not_contains(self):
+        path = Bip32PathParser.Parse("m/0'/1")
+
+        self.assertFalse(0 in path)
+        self.assertFalse(Bip32KeyIndex.HardenIndex(1) in path)
+        self.assertFalse(Bip32KeyIndex(2) in path)
+        self.assertRaises(TypeError, path.__contains__, "0")
+
+    # Test that path elements are shared between paths
+    def test_elems_cache(self):
+        path_1 = Bip32PathParser.Parse("m/44'/0'/0'/0/0")
+        path_2 = Bip32Path([Bip32KeyIndex.HardenIndex(44), Bip32KeyIndex.HardenIndex(0)]).AddElem(0)
+
+        self.assertIs(path_1[0], path_2[0])
+        self.assertIs(path_1[1], path_2[1])
+        self.assertIs(path_1[3], path_2[2])
+
     # Test invalid paths
     def test_invalid_paths(self):
         seed = binascii.unhexlify(b"000102030405060708090a0b0c0d0e0f")
@@ -217,6 +245,7 @@ class Bip32PathTests(unittest.TestCase):
     def __test_path(self, test, path):
         # Check length
         self.assertEqual(len(test["parsed"]), path.Length())
+        self.assertEqual(len(test["parsed"]), len(path))
         # Check string conversion
         self.assertEqual(test["to_str"], path.ToStr())
         self.assertEqual(test["to_str"], str(path))
@@ -229,6 +258,9 @@ class Bip32PathTests(unittest.TestCase):
             self.assertEqual(test_elem, int(path[idx]))
             self.assertEqual(test_elem, elem.ToInt())
             self.assertEqual(Bip32KeyIndex.IsHardenedIndex(test_elem), elem.IsHardened())
+            # Check if contained
+            self.assertTrue(test_elem in path)
+            self.assertTrue(Bip32KeyIndex(test_elem) in path)
 
         # Check by converting to list
         self.assertEqual(test["parsed"], path.ToList())
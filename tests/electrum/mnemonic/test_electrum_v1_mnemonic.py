@@ -26,6 +26,7 @@ from bip_utils import (
     ElectrumV1, ElectrumV1EntropyBitLen, ElectrumV1EntropyGenerator, ElectrumV1Languages, ElectrumV1MnemonicDecoder,
     ElectrumV1MnemonicGenerator, ElectrumV1MnemonicValidator, ElectrumV1SeedGenerator, ElectrumV1WordsNum
 )
+from bip_utils.electrum.mnemonic_v1.electrum_v1_mnemonic_utils import ElectrumV1WordsListGetter
 
 
 # Verified with the official Electrum wallet
@@ -166,6 +167,32 @@ class ElectrumV1MnemonicTests(unittest.TestCase):
             # Test address
             self.assertEqual(test["address"], ElectrumV1.FromSeed(seed).GetAddress(0, 0))
 
+    # Test decoding multiple mnemonics with the same decoder (automatic language detection)
+    def test_decoder_lang_detection(self):
+        decoder = ElectrumV1MnemonicDecoder(None)
+        for _ in range(2):
+            for test in TEST_VECT:
+                entropy = decoder.Decode(test["mnemonic"])
+                self.assertEqual(test["entropy"], binascii.hexlify(entropy))
+
+        # Words not in the detected words list shall still be rejected
+        self.assertRaises(ValueError, decoder.Decode, "hello " * 11 + "notaword")
+
+    # Test decoding words chunks that don't fit in 4 bytes
+    def test_decoder_chunk_overflow(self):
+        words_list = ElectrumV1WordsListGetter.Instance().GetByLanguage(ElectrumV1Languages.ENGLISH)
+        # Chunk value for indexes (1625, 1624, 1623) is higher than 2^32 - 1, test it in every position
+        valid_chunk = [words_list.GetWordAtIdx(i) for i in (0, 1, 2)]
+        overflow_chunk = [words_list.GetWordAtIdx(i) for i in (1625, 1624, 1623)]
+
+        for chunk_idx in range(4):
+            words = valid_chunk * chunk_idx + overflow_chunk + valid_chunk * (3 - chunk_idx)
+            mnemonic = " ".join(words)
+
+            self.assertRaises(ValueError, ElectrumV1MnemonicDecoder().Decode, mnemonic)
+            self.assertRaises(ValueError, ElectrumV1MnemonicDecoder(None).Decode, mnemonic)
+            self.assertFalse(ElectrumV1MnemonicValidator().IsValid(mnemonic))
+
     # Test entropy generator and construction from valid entropy bit lengths
     def test_entropy_valid_bitlen(self):
         for test_bit_len in ElectrumV1EntropyBitLen: